@@ -0,0 +1,30 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Blocking SDK calls (Supabase, Pinecone, Gemini) run on this pool instead of the loop's
+# default executor. On Python 3.9 asyncio.run() waits for the default executor without a
+# timeout, whereas this pool can drop its queued calls when the worker shuts down.
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="blocking-io")
+    return _executor
+
+async def run_blocking(func, *args, **kwargs):
+    """Runs a blocking call on the shared pool and awaits its result without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+def shutdown():
+    """
+    Cancels calls still queued on the pool and returns without waiting.
+    Calls already running cannot be interrupted and finish in the background.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
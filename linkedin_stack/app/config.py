@@ -18,3 +18,27 @@ SCRAPER_SERVICE_URL = os.getenv("SCRAPER_SERVICE_URL")
 
 # Google
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+
+# Startup
+# How heavy clients (Gemini, LangGraph, Pinecone) are initialized when the app starts:
+#   "background" - start serving immediately and warm up in a background thread (default)
+#   "blocking"   - warm up before the app accepts requests
+#   "off"        - initialize lazily on the first request that needs them
+WARMUP_MODES = ("background", "blocking", "off")
+WARMUP_MODE = os.getenv("WARMUP_MODE", "background").lower()
+if WARMUP_MODE not in WARMUP_MODES:
+    raise ValueError(f"Invalid WARMUP_MODE '{WARMUP_MODE}'. Expected one of: {', '.join(WARMUP_MODES)}.")
+
+# Scaling
+# Number of uvicorn worker processes (passed to uvicorn by the Dockerfile CMD; checked below).
+WORKERS = int(os.getenv("WORKERS", "1"))
+# Where state shared between workers lives: "local" (in-process, single worker only) or a Redis URL.
+STATE_BACKEND_URL = os.getenv("STATE_BACKEND_URL", "local")
+if WORKERS > 1 and STATE_BACKEND_URL == "local":
+    raise ValueError(f"WORKERS={WORKERS} requires a shared STATE_BACKEND_URL (e.g. redis://host:6379/0); the local backend only supports one worker.")
+# How long job statuses are kept, in seconds.
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "86400"))
+if JOB_TTL_SECONDS <= 0:
+    raise ValueError(f"Invalid JOB_TTL_SECONDS '{JOB_TTL_SECONDS}'. Expected a positive number of seconds.")
+# How long shutdown waits for in-flight generation jobs before marking them failed, in seconds.
+SHUTDOWN_DRAIN_TIMEOUT = float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "30"))
@@ -1,5 +1,8 @@
-from fastapi import FastAPI, Depends, status, HTTPException, BackgroundTasks
-from typing import List, Dict
+from fastapi import FastAPI, Depends, status, HTTPException
+from contextlib import asynccontextmanager
+from typing import List
+import asyncio
+import time
 import uuid
 import logging
 
@@ -7,8 +10,10 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-from . import models, auth
+from . import models, auth, blocking, config, state_backend
+from .blocking import run_blocking
 from .services import (
+    job_service,
     supabase_service,
     pinecone_service,
     generation_service,
@@ -17,15 +22,75 @@ from .services import (
 )
 from supabase import Client
 
+# Backoff bounds, in seconds, for retrying a failed warm-up
+WARMUP_RETRY_INITIAL_DELAY = 1.0
+WARMUP_RETRY_MAX_DELAY = 60.0
+
+def _warm_up_services() -> bool:
+    """Initializes the heavy service clients. Blocking, so it is run in a worker thread."""
+    generation_ready = generation_service.warm_up()
+    pinecone_ready = pinecone_service.warm_up()
+    return generation_ready and pinecone_ready
+
+async def _try_warm_up() -> bool:
+    """Runs one warm-up attempt off the event loop. Returns True if every service is ready."""
+    start = time.perf_counter()
+    try:
+        ready = await run_blocking(_warm_up_services)
+    except Exception as e:
+        logger.error(f"Warm-up attempt failed: {e}", exc_info=True)
+        ready = False
+    if ready:
+        logger.info(f"Services warmed up in {time.perf_counter() - start:.2f}s.")
+    return ready
+
+async def warm_up_services(delay: float = 0):
+    """
+    Retries the warm-up with exponential backoff until every service is ready, so a
+    replica whose first attempt failed still becomes ready without receiving traffic.
+    """
+    while True:
+        if delay:
+            await asyncio.sleep(delay)
+        if await _try_warm_up():
+            return
+        delay = min(max(delay * 2, WARMUP_RETRY_INITIAL_DELAY), WARMUP_RETRY_MAX_DELAY)
+        logger.warning(f"Some services are unavailable; retrying warm-up in {delay:.0f}s.")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warms up the service clients according to WARMUP_MODE. On shutdown, drains in-flight
+    generation jobs, then drops queued blocking calls and releases the shared-state
+    backend and HTTP client. Blocking calls already running cannot be interrupted.
+    """
+    state_backend.get_backend()
+    warmup_task = None
+    if config.WARMUP_MODE == "blocking":
+        logger.info("Warming up services before accepting requests.")
+        if not await _try_warm_up():
+            logger.warning("Some services are unavailable; retrying warm-up in the background.")
+            warmup_task = asyncio.create_task(warm_up_services(WARMUP_RETRY_INITIAL_DELAY))
+    elif config.WARMUP_MODE == "background":
+        logger.info("Warming up services in the background.")
+        warmup_task = asyncio.create_task(warm_up_services())
+    else:
+        logger.info("Warm-up disabled; services will initialize on first use.")
+    yield
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    await job_service.drain(config.SHUTDOWN_DRAIN_TIMEOUT)
+    blocking.shutdown()
+    await state_backend.close_backend()
+    await scraper_service.client.aclose()
+
 app = FastAPI(
     title="LinkedIn Post Generation Service",
     description="A service to generate LinkedIn posts for users.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# In-memory store for job statuses
-tasks: Dict[str, models.JobStatus] = {}
-
 async def run_manual_generation_task(
     task_id: str,
     user_id: str,
@@ -33,6 +98,8 @@ async def run_manual_generation_task(
     supabase: Client
 ):
     """The actual logic for generating a post, run in the background."""
+    save_post = None
+    saved_post = None
     try:
         # Log the start of the task
         logging.info(f"Starting manual generation task {task_id} for user {user_id} on topic: {request.topic}")
@@ -59,35 +126,70 @@ async def run_manual_generation_task(
         )
         logging.info(f"Generated post content for topic {request.topic}")
         
-        # Save the generated post
-        saved_post = await post_service.create_post(
+        # Save the generated post. The write is shielded so a shutdown cancel cannot
+        # leave it in an unknown state; the cancel handler waits for it instead.
+        save_post = asyncio.ensure_future(post_service.create_post(
             user_id=user_id,
             post_data=models.PostCreate(content=post_content),
             supabase=supabase
-        )
+        ))
+        saved_post = await asyncio.shield(save_post)
         logging.info(f"Saved post with ID {saved_post['id']}")
         
         # await supabase_service.increment_post_count(user_id, supabase)
         # logging.info(f"Incremented post count for user {user_id}")
         
         # Update task status to completed
-        tasks[task_id].status = "completed"
-        tasks[task_id].result = models.JobResult(post_id=saved_post['id'], content=saved_post['content'])
+        await job_service.save_completed_job(task_id, saved_post)
         logging.info(f"Task {task_id} completed successfully.")
         
+    except asyncio.CancelledError:
+        # The worker is shutting down and the drain timeout elapsed
+        if save_post is not None:
+            # The post is being (or has been) written; report it rather than inviting a retry
+            try:
+                saved_post = await save_post
+            except Exception as e:
+                logging.error(f"Task {task_id} failed while saving the post: {e}", exc_info=True)
+                await job_service.save_failed_job(task_id, str(e))
+            else:
+                await job_service.save_completed_job(task_id, saved_post)
+                logging.info(f"Task {task_id} completed during shutdown.")
+            raise
+        logging.warning(f"Task {task_id} interrupted by shutdown.")
+        await job_service.save_failed_job(task_id, "Interrupted by server shutdown. Please retry.")
+        raise
     except Exception as e:
+        if saved_post is not None:
+            # The post exists, so never report a failure that would invite a duplicate
+            logging.error(f"Task {task_id} saved post {saved_post['id']} but could not record completion after retries: {e}", exc_info=True)
+            return
         logging.error(f"Task {task_id} failed: {str(e)}", exc_info=True)
         # Update task status to failed
-        tasks[task_id].status = "failed"
-        tasks[task_id].result = models.JobResult(error=str(e))
+        await job_service.save_failed_job(task_id, str(e))
         logging.info(f"Task {task_id} marked as failed.")
 
 # --- Generation Endpoints ---
 
 @app.get("/health")
 def health_check():
+    """Liveness probe: the process is up and serving requests."""
     return {"status": "ok"}
 
+@app.get("/ready")
+def readiness_check():
+    """
+    Readiness probe: the LLM and Pinecone clients have been initialized.
+    With WARMUP_MODE=off the clients are built on first use, so readiness is not gated on them.
+    """
+    services = {
+        "generation": generation_service.is_ready(),
+        "pinecone": pinecone_service.is_ready(),
+    }
+    if config.WARMUP_MODE != "off" and not all(services.values()):
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail={"status": "warming_up", "services": services})
+    return {"status": "ready", "services": services}
+
 @app.post("/generate/auto", response_model=models.GeneratedPost)
 async def auto_generate_post(
     request: models.AutoGenerateRequest, user_id: str = Depends(auth.get_user_id_from_token), supabase: Client = Depends(auth.get_supabase_client)
@@ -109,20 +211,19 @@ async def auto_generate_post(
 @app.post("/generate/manual", response_model=models.JobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def manual_generate_post(
     request: models.ManualGenerateRequest,
-    background_tasks: BackgroundTasks,
     user_id: str = Depends(auth.get_user_id_from_token),
     supabase: Client = Depends(auth.get_supabase_client)
 ):
     """Accepts a request to generate a post and returns a task ID."""
     task_id = str(uuid.uuid4())
-    tasks[task_id] = models.JobStatus(task_id=task_id, status="pending")
-    background_tasks.add_task(run_manual_generation_task, task_id, user_id, request, supabase)
+    await job_service.save_job(models.JobStatus(task_id=task_id, status="pending"))
+    job_service.spawn(run_manual_generation_task(task_id, user_id, request, supabase))
     return models.JobResponse(task_id=task_id)
 
 @app.get("/generate/status/{task_id}", response_model=models.JobStatus)
 async def get_generation_status(task_id: str):
-    """Retrieves the status and result of a generation task."""
-    task = tasks.get(task_id)
+    """Retrieves the status and result of a generation task from whichever worker ran it."""
+    task = await job_service.get_job(task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
     return task
@@ -1,10 +1,9 @@
 import logging
+import threading
 from fastapi import HTTPException
-from langgraph.graph import StateGraph, END
 from typing import TypedDict, Annotated
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 from .. import config
+from ..blocking import run_blocking
 
 # --- 1. Define Graph State ---
 class GenerationState(TypedDict):
@@ -23,17 +22,31 @@ class GenerationState(TypedDict):
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# --- 2. Initialize the LLM ---
-# This will be used in our graph to generate the post.
-try:
-    llm = ChatGoogleGenerativeAI(model="gemini-1.5-flash-latest", google_api_key=config.GOOGLE_API_KEY, temperature=0.7)
-except Exception as e:
-    print(f"Failed to initialize Google Gemini LLM: {e}")
-    llm = None
+# --- 2. Lazily initialize the LLM and graph ---
+# langchain/langgraph are heavy to import, so the client and the compiled graph
+# are built on first use (or by the warm-up in main.py) instead of at import.
+_llm = None
+_app_graph = None
+_init_lock = threading.Lock()
+
+def get_llm():
+    """Returns the shared Gemini client, creating it on first call. Returns None if it cannot be built."""
+    global _llm
+    if _llm is None:
+        with _init_lock:
+            if _llm is None:
+                try:
+                    from langchain_google_genai import ChatGoogleGenerativeAI
+                    _llm = ChatGoogleGenerativeAI(model="gemini-1.5-flash-latest", google_api_key=config.GOOGLE_API_KEY, temperature=0.7)
+                except Exception as e:
+                    logger.error(f"Failed to initialize Google Gemini LLM: {e}")
+    return _llm
 
 # --- 3. Define Graph Nodes ---
 def build_prompt(state: GenerationState) -> GenerationState:
     """Constructs the final prompt for the LLM from the input state."""
+    from langchain_core.messages import SystemMessage, HumanMessage
+
     print("--- Node: build_prompt ---")
     system_prompt = (
         f"You are an expert B2B social media marketer specializing in LinkedIn. "
@@ -55,6 +68,7 @@ def build_prompt(state: GenerationState) -> GenerationState:
 def generate_post_node(state: GenerationState) -> GenerationState:
     """Calls the LLM to generate the LinkedIn post."""
     logger.info("--- [LLM] Node: generate_post_node ---")
+    llm = get_llm()
     if not llm:
         raise Exception("LLM service is not available. Check API Key.")
 
@@ -70,15 +84,37 @@ def generate_post_node(state: GenerationState) -> GenerationState:
         raise Exception(f"LLM invocation failed. Raw error: {e}")
 
 # --- 4. Build and Compile the Graph ---
-workflow = StateGraph(GenerationState)
-workflow.add_node("build_prompt", build_prompt)
-workflow.add_node("generate_post", generate_post_node)
+def get_app_graph():
+    """Returns the compiled LangGraph workflow, compiling it on first call. Returns None if it cannot be built."""
+    global _app_graph
+    if _app_graph is None:
+        with _init_lock:
+            if _app_graph is None:
+                try:
+                    from langgraph.graph import StateGraph, END
+
+                    workflow = StateGraph(GenerationState)
+                    workflow.add_node("build_prompt", build_prompt)
+                    workflow.add_node("generate_post", generate_post_node)
+
+                    workflow.set_entry_point("build_prompt")
+                    workflow.add_edge("build_prompt", "generate_post")
+                    workflow.add_edge("generate_post", END)
+
+                    _app_graph = workflow.compile()
+                except Exception as e:
+                    logger.error(f"Failed to compile the generation graph: {e}", exc_info=True)
+    return _app_graph
 
-workflow.set_entry_point("build_prompt")
-workflow.add_edge("build_prompt", "generate_post")
-workflow.add_edge("generate_post", END)
+def warm_up() -> bool:
+    """Eagerly builds the LLM client and compiled graph. Returns True if both are usable."""
+    app_graph = get_app_graph()
+    llm = get_llm()
+    return app_graph is not None and llm is not None
 
-app_graph = workflow.compile()
+def is_ready() -> bool:
+    """True once the LLM client and compiled graph have been initialized."""
+    return _llm is not None and _app_graph is not None
 
 # --- 5. Main Service Function ---
 async def generate(
@@ -97,7 +133,11 @@ async def generate(
             "length": length,
             "instructions": instructions
         }
-        final_state = app_graph.invoke(inputs)
+        # Graph construction and the LLM call are blocking, so keep them off the event loop
+        app_graph = await run_blocking(get_app_graph)
+        if not app_graph:
+            raise Exception("Generation workflow is not available. Check server logs.")
+        final_state = await run_blocking(app_graph.invoke, inputs)
         return final_state.get("generated_post", "Error: Could not generate post.")
     except Exception as e:
         logger.error(f"--- [LLM] Error during graph invocation: {e} ---", exc_info=True)
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import logging
+from typing import Coroutine, Optional, Set
+from .. import config, models
+from ..state_backend import get_backend
+
+logger = logging.getLogger(__name__)
+
+# Generation jobs running in this process, so shutdown can wait for them.
+_inflight: Set[asyncio.Task] = set()
+
+# Attempts and initial backoff, in seconds, for recording a completed job. The post
+# already exists at that point, so giving up early would leave the job "pending".
+COMPLETION_SAVE_ATTEMPTS = 3
+COMPLETION_SAVE_DELAY = 0.5
+
+def _job_key(task_id: str) -> str:
+    return f"job:{task_id}"
+
+async def save_job(job: models.JobStatus):
+    """Stores a job status in the shared backend so any worker can serve it."""
+    await get_backend().set(_job_key(job.task_id), json.dumps(job.dict()), ttl=config.JOB_TTL_SECONDS)
+
+async def get_job(task_id: str) -> Optional[models.JobStatus]:
+    """Loads a job status from the shared backend, or None if it is unknown or expired."""
+    raw = await get_backend().get(_job_key(task_id))
+    if raw is None:
+        return None
+    return models.JobStatus(**json.loads(raw))
+
+async def save_completed_job(task_id: str, saved_post: dict):
+    """Records a job as completed with the saved post, retrying transient backend errors."""
+    job = models.JobStatus(
+        task_id=task_id,
+        status="completed",
+        result=models.JobResult(post_id=saved_post['id'], content=saved_post['content'])
+    )
+    delay = COMPLETION_SAVE_DELAY
+    for attempt in range(1, COMPLETION_SAVE_ATTEMPTS + 1):
+        try:
+            await save_job(job)
+            return
+        except Exception as e:
+            if attempt == COMPLETION_SAVE_ATTEMPTS:
+                raise
+            logger.warning(f"Could not record completion of task {task_id} (attempt {attempt}): {e}; retrying in {delay}s.")
+            await asyncio.sleep(delay)
+            delay *= 2
+
+async def save_failed_job(task_id: str, error: str):
+    """Records a job as failed with the given error message."""
+    await save_job(models.JobStatus(
+        task_id=task_id,
+        status="failed",
+        result=models.JobResult(error=error)
+    ))
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    """Runs a generation job in the background and tracks it until it finishes."""
+    task = asyncio.create_task(coro)
+    _inflight.add(task)
+    task.add_done_callback(_inflight.discard)
+    return task
+
+async def drain(timeout: float):
+    """
+    Waits up to `timeout` seconds for in-flight jobs to finish, then cancels the rest.
+    Cancelled jobs are expected to record themselves as failed.
+    """
+    if not _inflight:
+        return
+    logger.info(f"Draining {len(_inflight)} in-flight generation job(s), waiting up to {timeout}s.")
+    _, pending = await asyncio.wait(set(_inflight), timeout=timeout)
+    if pending:
+        logger.warning(f"Cancelling {len(pending)} generation job(s) still running after {timeout}s.")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
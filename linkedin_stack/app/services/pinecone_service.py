@@ -1,22 +1,53 @@
 import logging
-from pinecone import Pinecone, EmbedModel
+import threading
 from supabase import Client
 from .. import config
+from ..blocking import run_blocking
 from . import supabase_service
 from fastapi import HTTPException
 
 logging.basicConfig(level=logging.INFO)
 
 # --- Pinecone Initialization ---
-try:
-    pc = Pinecone(api_key=config.PINECONE_API_KEY)
-    pc_index = pc.Index(config.PINECONE_INDEX_NAME)
-except Exception as e:
-    logging.error(f"Could not initialize Pinecone: {e}")
-    pc_index = None
+# The client and index handle are created on first use (or by the warm-up in main.py)
+# so importing this module does not pay for the pinecone import and network handshake.
+_pc = None
+_pc_index = None
+_init_lock = threading.Lock()
+
+def get_client():
+    """
+    Returns the shared (Pinecone client, index) pair, connecting on first call.
+    Returns (None, None) if Pinecone could not be initialized; the next call retries.
+    """
+    global _pc, _pc_index
+    if _pc_index is None:
+        with _init_lock:
+            if _pc_index is None:
+                try:
+                    from pinecone import Pinecone
+                    pc = Pinecone(api_key=config.PINECONE_API_KEY)
+                    _pc_index = pc.Index(config.PINECONE_INDEX_NAME)
+                    _pc = pc
+                except Exception as e:
+                    logging.error(f"Could not initialize Pinecone: {e}")
+    return _pc, _pc_index
+
+def warm_up() -> bool:
+    """Eagerly connects to Pinecone. Returns True if the index is usable."""
+    return get_client()[1] is not None
+
+def is_ready() -> bool:
+    """True once the Pinecone index handle has been initialized."""
+    return _pc_index is not None
+
+def _embed_model():
+    from pinecone import EmbedModel
+    return EmbedModel.Multilingual_E5_Large
 
 async def get_context_for_auto_post(user_id: str, supabase: Client) -> str:
     """Retrieves context from Pinecone using the user's initial profile scrape."""
+    pc, pc_index = await run_blocking(get_client)
     if not pc_index:
         logging.error("Pinecone index is not available.")
         raise HTTPException(status_code=503, detail="Content generation service is currently unavailable.")
@@ -29,8 +60,9 @@ async def get_context_for_auto_post(user_id: str, supabase: Client) -> str:
             return "" # Return empty context if no profile text is available.
 
         logging.info(f"[{user_id}] Generating query embedding for auto-post.")
-        query_embeddings_response = pc.inference.embed(
-            model=EmbedModel.Multilingual_E5_Large, 
+        query_embeddings_response = await run_blocking(
+            pc.inference.embed,
+            model=_embed_model(), 
             inputs=[profile_text],
             parameters={"input_type": "query"}
         )
@@ -42,7 +74,8 @@ async def get_context_for_auto_post(user_id: str, supabase: Client) -> str:
         logging.info(f"[{user_id}] Successfully generated query embedding for auto-post.")
 
         logging.info(f"[{user_id}] Querying Pinecone for auto-post context.")
-        query_response = pc_index.query(
+        query_response = await run_blocking(
+            pc_index.query,
             vector=query_embedding,
             top_k=5,
             namespace=user_id,
@@ -66,6 +99,7 @@ async def get_context_for_manual_post(user_id: str, topic: str, job_id: str) ->
     """
     Retrieves context for a manual post with detailed, multi-stage debugging.
     """
+    pc, pc_index = await run_blocking(get_client)
     if not pc_index:
         logging.error("Pinecone index is not available.")
         raise HTTPException(status_code=503, detail="Content generation service is currently unavailable.")
@@ -73,8 +107,9 @@ async def get_context_for_manual_post(user_id: str, topic: str, job_id: str) ->
     # Stage 1: Embedding Generation
     try:
         logging.info(f"[{user_id}] [Debug] Stage 1: Generating embedding for topic: '{topic}'.")
-        query_embeddings_response = pc.inference.embed(
-            model=EmbedModel.Multilingual_E5_Large,
+        query_embeddings_response = await run_blocking(
+            pc.inference.embed,
+            model=_embed_model(),
             inputs=[topic],
             parameters={"input_type": "query"}
         )
@@ -91,7 +126,8 @@ async def get_context_for_manual_post(user_id: str, topic: str, job_id: str) ->
     # Stage 2: Pinecone Query
     try:
         logging.info(f"[{user_id}] [Debug] Stage 2: Querying Pinecone with namespace '{user_id}'.")
-        query_response = pc_index.query(
+        query_response = await run_blocking(
+            pc_index.query,
             vector=query_embedding,
             top_k=5,
             namespace=user_id,
@@ -1,16 +1,17 @@
 from supabase import Client
 from .. import models
+from ..blocking import run_blocking
 from fastapi import HTTPException, status
 import datetime
 
 async def create_post(user_id: str, post_data: models.PostCreate, supabase: Client) -> dict:
     """Saves a new post to the database."""
     try:
-        response = supabase.table('linkedin_posts').insert({
+        response = await run_blocking(supabase.table('linkedin_posts').insert({
             'user_id': user_id,
             'content': post_data.content,
             'status': 'draft' # Default status
-        }).execute()
+        }).execute)
 
         if response.data:
             return response.data[0]
@@ -21,7 +22,7 @@ async def create_post(user_id: str, post_data: models.PostCreate, supabase: Clie
 async def get_posts(user_id: str, supabase: Client) -> list[dict]:
     """Retrieves all posts for a given user."""
     try:
-        response = supabase.table('linkedin_posts').select('*').eq('user_id', user_id).order('created_at', desc=True).execute()
+        response = await run_blocking(supabase.table('linkedin_posts').select('*').eq('user_id', user_id).order('created_at', desc=True).execute)
         return response.data
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -29,7 +30,7 @@ async def get_posts(user_id: str, supabase: Client) -> list[dict]:
 async def get_post(user_id: str, post_id: str, supabase: Client) -> dict:
     """Retrieves a single post by its ID, ensuring user ownership."""
     try:
-        response = supabase.table('linkedin_posts').select('*').eq('id', post_id).eq('user_id', user_id).single().execute()
+        response = await run_blocking(supabase.table('linkedin_posts').select('*').eq('id', post_id).eq('user_id', user_id).single().execute)
         if response.data:
             return response.data
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
@@ -42,10 +43,10 @@ async def update_post(user_id: str, post_id: str, post_data: models.PostUpdate,
     await get_post(user_id, post_id, supabase)
     
     try:
-        response = supabase.table('linkedin_posts').update({
+        response = await run_blocking(supabase.table('linkedin_posts').update({
             'content': post_data.content,
             'updated_at': datetime.datetime.now().isoformat()
-        }).eq('id', post_id).execute()
+        }).eq('id', post_id).execute)
 
         if response.data:
             return response.data[0]
@@ -59,7 +60,7 @@ async def delete_post(user_id: str, post_id: str, supabase: Client):
     await get_post(user_id, post_id, supabase)
     
     try:
-        supabase.table('linkedin_posts').delete().eq('id', post_id).execute()
+        await run_blocking(supabase.table('linkedin_posts').delete().eq('id', post_id).execute)
         return
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
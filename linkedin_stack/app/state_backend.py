@@ -0,0 +1,125 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+from . import config
+
+class StateBackend(ABC):
+    """
+    Key/value store for state that must be shared between worker processes:
+    job statuses, caches and rate-limit counters. Values are strings; callers serialize.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str):
+        ...
+
+    @abstractmethod
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        """Atomically increments a counter. The TTL is applied when the counter is created."""
+        ...
+
+    async def close(self):
+        pass
+
+class LocalStateBackend(StateBackend):
+    """
+    In-process stand-in for tests and single-worker deployments. State is NOT shared between
+    processes, so config rejects it when WORKERS > 1.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+
+    def _get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._get_entry(key)
+        return entry[0] if entry else None
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (value, expires_at)
+
+    async def delete(self, key: str):
+        self._data.pop(key, None)
+
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        entry = self._get_entry(key)
+        if entry:
+            value, expires_at = int(entry[0]) + 1, entry[1]
+        else:
+            value, expires_at = 1, time.monotonic() + ttl if ttl else None
+        self._data[key] = (str(value), expires_at)
+        return value
+
+class RedisStateBackend(StateBackend):
+    """Redis-backed store shared by every worker and replica pointing at the same URL."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._client = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        # Redis rejects EX 0, so treat a zero TTL as "no expiry" like LocalStateBackend
+        await self._client.set(key, value, ex=ttl or None)
+
+    async def delete(self, key: str):
+        await self._client.delete(key)
+
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        if not ttl:
+            return await self._client.incr(key)
+        # Create the counter with its TTL and increment it in one MULTI/EXEC transaction,
+        # so a counter can never exist without an expiry.
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(key, 0, ex=ttl, nx=True)
+            pipe.incr(key)
+            _, value = await pipe.execute()
+        return value
+
+    async def close(self):
+        await self._client.aclose()
+
+_backend: Optional[StateBackend] = None
+
+def create_backend(url: str) -> StateBackend:
+    """Builds a backend from a URL: "local" for in-process state, "redis://..." for Redis."""
+    if url == "local":
+        return LocalStateBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateBackend(url)
+    raise ValueError(f"Unsupported STATE_BACKEND_URL: {url}")
+
+def get_backend() -> StateBackend:
+    """Returns this process's shared-state backend, creating it from config on first call."""
+    global _backend
+    if _backend is None:
+        _backend = create_backend(config.STATE_BACKEND_URL)
+    return _backend
+
+def set_backend(backend: Optional[StateBackend]):
+    """Overrides the process-wide backend, e.g. with a LocalStateBackend in tests."""
+    global _backend
+    _backend = backend
+
+async def close_backend():
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
@@ -0,0 +1,106 @@
+"""
+Measures cold-start time of the generation service.
+
+For each WARMUP_MODE this spawns a fresh uvicorn process and records how long it
+takes until /health (liveness) and /ready (readiness) first return 200. With
+WARMUP_MODE=off, /ready is not gated on the clients, so the cost moves to the first
+request that needs them; that is reported as "first use", timed in a fresh process
+that imports the app and initializes the clients the way such a request would.
+A mode whose server does not become ready within --timeout is reported as "timeout".
+
+Run from the linkedin_stack directory:
+    python benchmarks/startup_benchmark.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+MODES = ["off", "background", "blocking"]
+
+FIRST_USE_SCRIPT = """
+import time
+import app.main as main
+start = time.perf_counter()
+ready = main._warm_up_services()
+print(time.perf_counter() - start if ready else "failed")
+"""
+
+def wait_for(url: str, deadline: float) -> float:
+    """Polls url until it returns 200 and returns the time it happened, or raises on timeout."""
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.02)
+    raise TimeoutError(f"{url} did not become available")
+
+def measure(mode: str, port: int, timeout: float) -> tuple:
+    """Starts one server process and returns (seconds to /health, seconds to /ready)."""
+    env = dict(os.environ, WARMUP_MODE=mode)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = start + timeout
+        health = wait_for(f"http://127.0.0.1:{port}/health", deadline) - start
+        ready = wait_for(f"http://127.0.0.1:{port}/ready", deadline) - start
+        return health, ready
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def measure_first_use(timeout: float):
+    """Returns the seconds a lazily-initialized process spends building its clients on first use."""
+    env = dict(os.environ, WARMUP_MODE="off")
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_USE_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    output = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not output or output[-1] == "failed":
+        raise RuntimeError("client initialization failed")
+    return float(output[-1])
+
+def format_median(values: list) -> str:
+    return f"{statistics.median(values):.3f}" if values else "-"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'health (s)':>12}{'ready (s)':>12}{'first use (s)':>15}")
+    for mode in MODES:
+        try:
+            results = [measure(mode, args.port, args.timeout) for _ in range(args.runs)]
+            first_use = []
+            if mode == "off":
+                first_use = [measure_first_use(args.timeout) for _ in range(args.runs)]
+        except (TimeoutError, subprocess.TimeoutExpired):
+            print(f"{mode:<12}{'timeout':>12}")
+            continue
+        except RuntimeError as e:
+            print(f"{mode:<12}{'error: ' + str(e):>12}")
+            continue
+        health = format_median([r[0] for r in results])
+        ready = format_median([r[1] for r in results])
+        print(f"{mode:<12}{health:>12}{ready:>12}{format_median(first_use):>15}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures request throughput of the generation service as the worker count grows.
+
+For each worker count this starts uvicorn with --workers N, seeds a completed job in
+the shared-state backend and drives GET /generate/status/<id> from several client
+processes for a fixed duration, reporting requests per second. Every request reads
+the job from the backend, so this needs STATE_BACKEND_URL pointing at Redis (the
+local backend is per-process and the seeded job would be invisible to the server).
+
+The client processes share the machine with the server; for numbers that are not
+bounded by the load generator, pin them to separate cores or run an external tool
+(wrk, hey) against the URL printed for each run.
+
+Run from the linkedin_stack directory:
+    STATE_BACKEND_URL=redis://localhost:6379/0 \
+        python benchmarks/throughput_benchmark.py --workers 1 2 4 --clients 4 --duration 10
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import config, models, state_backend
+from app.services import job_service
+from startup_benchmark import wait_for
+
+TASK_ID = "throughput-benchmark"
+
+async def seed_job():
+    """Stores a completed job so status lookups return 200 through the backend."""
+    state_backend.set_backend(state_backend.create_backend(config.STATE_BACKEND_URL))
+    try:
+        await job_service.save_job(models.JobStatus(
+            task_id=TASK_ID,
+            status="completed",
+            result=models.JobResult(post_id=TASK_ID, content="Benchmark post.")
+        ))
+    finally:
+        await state_backend.close_backend()
+
+async def drive(url: str, concurrency: int, duration: float) -> int:
+    """Sends requests over `concurrency` connections for `duration` seconds and returns the count completed."""
+    completed = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        async def worker():
+            nonlocal completed
+            while time.perf_counter() < deadline:
+                response = await client.get(url)
+                response.raise_for_status()
+                completed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return completed
+
+def run_client(args: tuple) -> int:
+    """Entry point for one load-generating process."""
+    url, concurrency, duration = args
+    return asyncio.run(drive(url, concurrency, duration))
+
+def measure(workers: int, args) -> float:
+    """Starts a server with the given worker count and returns its throughput in requests/s."""
+    env = dict(os.environ, WORKERS=str(workers), WARMUP_MODE="off")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(args.port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        base = f"http://127.0.0.1:{args.port}"
+        wait_for(f"{base}/health", time.perf_counter() + args.timeout)
+        # Give the remaining workers a moment to finish booting
+        time.sleep(1.0)
+        url = f"{base}/generate/status/{TASK_ID}"
+        print(f"  driving {url} from {args.clients} process(es)", file=sys.stderr)
+        with multiprocessing.Pool(args.clients) as pool:
+            counts = pool.map(run_client, [(url, args.concurrency, args.duration)] * args.clients)
+        return sum(counts) / args.duration
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 1, help="load-generating processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="connections per client process")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    if config.STATE_BACKEND_URL == "local":
+        sys.exit("Set STATE_BACKEND_URL to a Redis URL; the local backend is not shared with the server.")
+    asyncio.run(seed_job())
+
+    print(f"{'workers':<10}{'req/s':>12}{'speedup':>10}")
+    baseline = None
+    for workers in args.workers:
+        rps = measure(workers, args)
+        baseline = baseline or rps
+        print(f"{workers:<10}{rps:>12.1f}{rps / baseline:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
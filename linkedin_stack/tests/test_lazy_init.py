@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi import HTTPException
+
+from app import config, main
+from app.services import generation_service, pinecone_service
+
+HEAVY_MODULES = ("langchain_google_genai", "langgraph", "pinecone")
+
+IMPORT_SCRIPT = """
+import sys
+import app.services.generation_service
+import app.services.pinecone_service
+print(",".join(name for name in {modules!r} if name in sys.modules))
+"""
+
+
+def test_importing_services_does_not_load_heavy_clients():
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(modules=HEAVY_MODULES)],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+@pytest.fixture
+def services_not_ready(monkeypatch):
+    monkeypatch.setattr(generation_service, "is_ready", lambda: False)
+    monkeypatch.setattr(pinecone_service, "is_ready", lambda: False)
+
+
+def test_ready_is_503_while_warming_up(monkeypatch, services_not_ready):
+    monkeypatch.setattr(config, "WARMUP_MODE", "background")
+    with pytest.raises(HTTPException) as exc_info:
+        main.readiness_check()
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail["status"] == "warming_up"
+
+
+def test_ready_is_not_gated_when_warm_up_is_off(monkeypatch, services_not_ready):
+    monkeypatch.setattr(config, "WARMUP_MODE", "off")
+    assert main.readiness_check()["status"] == "ready"
+
+
+def test_ready_once_services_are_initialized(monkeypatch):
+    monkeypatch.setattr(config, "WARMUP_MODE", "background")
+    monkeypatch.setattr(generation_service, "is_ready", lambda: True)
+    monkeypatch.setattr(pinecone_service, "is_ready", lambda: True)
+    assert main.readiness_check()["status"] == "ready"
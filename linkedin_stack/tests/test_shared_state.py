@@ -0,0 +1,166 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app import models, state_backend
+from app.services import job_service
+
+
+@pytest.fixture
+def backend():
+    backend = state_backend.LocalStateBackend()
+    state_backend.set_backend(backend)
+    yield backend
+    state_backend.set_backend(None)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controls the monotonic clock the local backend uses for expiry."""
+    now = [1000.0]
+    monkeypatch.setattr(state_backend.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def redis_backend(monkeypatch):
+    """A RedisStateBackend talking to an in-memory fakeredis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis.asyncio
+
+    monkeypatch.setattr(redis.asyncio, "from_url", fakeredis.aioredis.FakeRedis.from_url)
+    return state_backend.create_backend("redis://localhost:6379/0")
+
+
+def test_redis_set_and_incr_expire(redis_backend):
+    async def scenario():
+        try:
+            await redis_backend.set("cache:a", "value", ttl=1)
+            await redis_backend.set("cache:b", "forever", ttl=0)
+            assert await redis_backend.incr("rate:user", ttl=2) == 1
+            assert await redis_backend.get("cache:a") == "value"
+
+            await asyncio.sleep(1.1)
+            assert await redis_backend.get("cache:a") is None
+            assert await redis_backend.get("cache:b") == "forever"
+            # The window started at creation, so incrementing does not extend it
+            assert await redis_backend.incr("rate:user", ttl=2) == 2
+
+            await asyncio.sleep(1.0)
+            assert await redis_backend.incr("rate:user", ttl=2) == 1
+        finally:
+            await redis_backend.close()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("env", [
+    {"WORKERS": "2", "STATE_BACKEND_URL": "local"},
+    {"JOB_TTL_SECONDS": "0"},
+])
+def test_config_rejects_unsupported_settings(env):
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.config"],
+        cwd=project_dir,
+        env=dict(os.environ, **env),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "ValueError" in result.stderr
+
+
+def test_set_and_get_respect_ttl(backend, clock):
+    async def scenario():
+        await backend.set("cache:a", "value", ttl=10)
+        await backend.set("cache:b", "forever")
+        assert await backend.get("cache:a") == "value"
+        clock[0] += 10
+        assert await backend.get("cache:a") is None
+        assert await backend.get("cache:b") == "forever"
+        await backend.delete("cache:b")
+        assert await backend.get("cache:b") is None
+
+    asyncio.run(scenario())
+
+
+def test_incr_keeps_ttl_from_creation(backend, clock):
+    async def scenario():
+        assert await backend.incr("rate:user", ttl=60) == 1
+        clock[0] += 30
+        assert await backend.incr("rate:user", ttl=60) == 2
+        clock[0] += 30
+        # The window started at creation, so the counter resets instead of being extended
+        assert await backend.incr("rate:user", ttl=60) == 1
+
+    asyncio.run(scenario())
+
+
+def test_job_round_trip(backend):
+    async def scenario():
+        assert await job_service.get_job("missing") is None
+        job = models.JobStatus(
+            task_id="t1",
+            status="completed",
+            result=models.JobResult(post_id="p1", content="Hello")
+        )
+        await job_service.save_job(job)
+        assert await job_service.get_job("t1") == job
+
+    asyncio.run(scenario())
+
+
+def test_completed_job_is_recorded_after_transient_errors(backend, monkeypatch):
+    monkeypatch.setattr(job_service, "COMPLETION_SAVE_DELAY", 0)
+    real_set = backend.set
+    failures = [2]
+
+    async def flaky_set(key, value, ttl=None):
+        if failures[0]:
+            failures[0] -= 1
+            raise ConnectionError("backend unavailable")
+        await real_set(key, value, ttl)
+
+    monkeypatch.setattr(backend, "set", flaky_set)
+
+    async def scenario():
+        await job_service.save_completed_job("t2", {"id": "p2", "content": "Hello"})
+        job = await job_service.get_job("t2")
+        assert job.status == "completed"
+        assert job.result.post_id == "p2"
+
+    asyncio.run(scenario())
+
+
+def test_drain_waits_for_finished_jobs(backend):
+    async def quick_job():
+        await asyncio.sleep(0.01)
+        await job_service.save_job(models.JobStatus(task_id="quick", status="completed"))
+
+    async def scenario():
+        job_service.spawn(quick_job())
+        await job_service.drain(timeout=1.0)
+        assert (await job_service.get_job("quick")).status == "completed"
+
+    asyncio.run(scenario())
+
+
+def test_drain_cancels_jobs_past_timeout(backend):
+    async def slow_job():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            await job_service.save_failed_job("slow", "Interrupted by server shutdown. Please retry.")
+            raise
+
+    async def scenario():
+        task = job_service.spawn(slow_job())
+        await job_service.drain(timeout=0.01)
+        assert task.cancelled()
+        assert (await job_service.get_job("slow")).status == "failed"
+
+    asyncio.run(scenario())